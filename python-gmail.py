@@ -11,11 +11,44 @@ import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
-def send_email(sender_email, receiver_email, app_password, subject, text, html):
+SMTP_TIMEOUT = 10
+
+class GmailSender:
+    def __init__(self, sender_email, app_password, timeout=SMTP_TIMEOUT):
+        self.sender_email = sender_email
+        self.app_password = app_password
+        self.timeout = timeout
+        self.server = None
+
+    def __enter__(self):
+        self.server = smtplib.SMTP_SSL("smtp.gmail.com", 465, timeout=self.timeout)
+        try:
+            self.server.login(self.sender_email, self.app_password)
+        except BaseException:
+            self.server.close()
+            self.server = None
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            self.server.quit()
+        except smtplib.SMTPServerDisconnected:
+            pass
+        finally:
+            self.server = None
+
+    def send(self, message):
+        self.server.send_message(message)
+
+def build_message(sender_email, receiver_email, subject, text, html):
     message = MIMEMultipart("alternative")
     message["Subject"] = subject
     message["From"] = sender_email
-    message["To"] = receiver_email
+    if isinstance(receiver_email, str):
+        message["To"] = receiver_email
+    else:
+        message["To"] = ", ".join(receiver_email)
 
     part1 = MIMEText(text, "plain")
     part2 = MIMEText(html, "html")
@@ -23,9 +56,17 @@ def send_email(sender_email, receiver_email, app_password, subject, text, html):
     message.attach(part1)
     message.attach(part2)
 
-    with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-        server.login(sender_email, app_password)
-        server.sendmail(sender_email, receiver_email, message.as_string())
+    return message
+
+def send_email(sender_email, receiver_email, app_password, subject, text, html, sender=None):
+    message = build_message(sender_email, receiver_email, subject, text, html)
+
+    if sender is not None:
+        sender.send(message)
+        return
+
+    with GmailSender(sender_email, app_password) as sender:
+        sender.send(message)
 
 if __name__ == "__main__":
     sender_email = "whatwant@whatwant.com"
@@ -36,4 +77,5 @@ if __name__ == "__main__":
     text = "whatwant is a good man."
     html = f"<html><body><p>{text}</p></body></html>"
 
-    send_email(sender_email, receiver_email, app_password, subject, text, html)
\ No newline at end of file
+    with GmailSender(sender_email, app_password) as sender:
+        send_email(sender_email, receiver_email, app_password, subject, text, html, sender=sender)